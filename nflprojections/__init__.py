@@ -2,8 +2,29 @@
 # -*- coding: utf-8 -*-
 # Copyright (C) 2020 Eric Truett
 # Licensed under the MIT License
-from .nflprojections import ProjectionCombiner, ProjectionSource
 
+import importlib
 import logging
+from typing import TYPE_CHECKING
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+if TYPE_CHECKING:
+    from .nflprojections import ProjectionCombiner, ProjectionSource
+
+__all__ = ['ProjectionCombiner', 'ProjectionSource']
+
+
+def __getattr__(name):
+    """Defers importing pandas, numpy, nflnames and nflschedule until a class or submodule is requested"""
+    if name in __all__:
+        from . import nflprojections
+        value = globals()[name] = getattr(nflprojections, name)
+        return value
+    if name == 'nflprojections':
+        return importlib.import_module(f'{__name__}.nflprojections')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | {'nflprojections'})
@@ -3,10 +3,11 @@
 # Copyright (C) 2020 Eric Truett
 # Licensed under the MIT License
 
+import functools
 import logging
 from pathlib import Path
 import re
-from typing import Dict, List, Union
+from typing import Callable, Dict, List, Union
 
 import numpy as np
 import pandas as pd
@@ -18,6 +19,26 @@ import nflschedule
 Standardized = Union[List[str], pd.Series]
 
 
+def _map_unique(values: pd.Series, func: Callable[[str], str]) -> pd.Series:
+    """Calls func once per distinct value and maps the results back onto values"""
+    if values.empty:
+        return values.copy()
+    uniques = values.unique()
+    return values.map(dict(zip(uniques, [func(v) for v in uniques])))
+
+
+@functools.lru_cache(maxsize=256)
+def _standardize_position(pos: str) -> str:
+    """Memoized nflnames.standardize_positions"""
+    return nflnames.standardize_positions(pos)
+
+
+@functools.lru_cache(maxsize=256)
+def _standardize_team_code(team: str) -> str:
+    """Memoized nflnames.standardize_team_code"""
+    return nflnames.standardize_team_code(team)
+
+
 class ProjectionSource:
 
     REQUIRED_MAPPED_COLUMNS = {'season', 'week', 'plyr', 'pos', 'team', 'proj'}
@@ -126,14 +147,14 @@ class ProjectionSource:
     def standardize_positions(self, positions: Standardized) -> Standardized:
         """Standardizes player positions"""
         if isinstance(positions, (list, tuple, set)):
-            return [nflnames.standardize_positions(pos) for pos in positions]
-        return positions.apply(nflnames.standardize_positions)
+            return [_standardize_position(pos) for pos in positions]
+        return _map_unique(positions, _standardize_position)
 
     def standardize_teams(self, teams: Standardized) -> Standardized:
         """Standardizes team names"""
         if isinstance(teams, (list, tuple, set)):
-            return [nflnames.standardize_team_code(t) for t in teams]
-        return teams.apply(nflnames.standardize_team_code)
+            return [_standardize_team_code(t) for t in teams]
+        return _map_unique(teams, _standardize_team_code)
               
 
 class ProjectionCombiner:
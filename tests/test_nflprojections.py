@@ -4,60 +4,70 @@
 # Licensed under the MIT License
 
 from pathlib import Path
+from types import MappingProxyType
 
-import pandas as pd
 import pytest
 
-from nflprojections import ProjectionSource
-from nflschedule import current_season, current_week
 
+@pytest.fixture(scope="module")
+def projection_source():
+    from nflprojections import ProjectionSource
+    return ProjectionSource
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mapping():
-    return {
+    return MappingProxyType({
       'seas': 'season',
       'wk': 'week',
       'player_name': 'plyr',
       'team': 'team',
       'fppg': 'proj',
       'position': 'pos'
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def psparams(mapping):
-    return {
+    import nflschedule
+    return MappingProxyType({
         'rawdir': Path.home(),
         'procdir': Path.home(),
         'column_mapping': mapping,
-        'season': current_season(),
-        'week': current_week(),
+        'season': nflschedule.current_season(),
+        'week': nflschedule.current_week(),
         'site_name': 'all',
         'slate_name': 'all',
         'raw_format': 'csv',
         'processed_format': 'parquet'
-    }
+    })
     
 
+@pytest.fixture(scope="module")
+def ps(projection_source, psparams):
+    return projection_source(**psparams)
+
+
 @pytest.fixture
-def ps(psparams):
-    return ProjectionSource(**psparams)
+def mutable_psparams(psparams):
+    """Per-test copy of psparams for tests that modify it"""
+    return dict(psparams, column_mapping=dict(psparams['column_mapping']))
     
 
-def test_init(psparams):
-    assert isinstance(ProjectionSource(**psparams), ProjectionSource)
+def test_init(projection_source, ps):
+    assert isinstance(ps, projection_source)
 
 
-def test_init_missing_param(psparams):
+def test_init_missing_param(projection_source, mutable_psparams):
     with pytest.raises(TypeError):      
-        _ = psparams.pop('rawdir')
-        ps = ProjectionSource(**psparams)
+        _ = mutable_psparams.pop('rawdir')
+        ps = projection_source(**mutable_psparams)
 
 
-def test_init_missing_mapping(psparams):
+def test_init_missing_mapping(projection_source, mutable_psparams):
     with pytest.raises(AssertionError):      
-        _ = psparams['column_mapping'].pop('wk')
-        ps = ProjectionSource(**psparams)
+        _ = mutable_psparams['column_mapping'].pop('wk')
+        ps = projection_source(**mutable_psparams)
 
 
 def test_load_raw(ps):
@@ -86,10 +96,10 @@ def test_remap_columns(ps, mapping):
     assert set(ps.remap_columns(cols)) == set(mapping.values())
 
 
-def test_remap_columns_extras(psparams, mapping):
+def test_remap_columns_extras(projection_source, mutable_psparams, mapping):
     newmapping = mapping | {'extra_key': 'extra_value'}
-    psparams['column_mapping'] = newmapping
-    newps = ProjectionSource(**psparams)
+    mutable_psparams['column_mapping'] = newmapping
+    newps = projection_source(**mutable_psparams)
     cols = list(newmapping.keys())
     assert set(newps.remap_columns(cols)) == set(newmapping.values())
 
@@ -106,6 +116,16 @@ def test_standardize_players(ps):
     assert ps.standardize_players(s) == ['henry ruggs', 'will fuller']
 
 
+def test_standardize_players_series(ps):
+    """Tests standardize_players with repeated names in a Series"""
+    import pandas as pd
+    s = pd.Series(['Henry Ruggs IV', 'Will Fuller V', 'Henry Ruggs IV'], index=[10, 4, 7])
+    result = ps.standardize_players(s)
+    assert result.tolist() == ['henry ruggs', 'will fuller', 'henry ruggs']
+    assert result.index.tolist() == [10, 4, 7]
+    assert result.dtype == s.dtype
+
+
 def test_standardize_positions(ps):
     """Tests standardize_positions"""
     # def standardize_positions(self, positions: Standardized) -> Standardized:
@@ -113,8 +133,47 @@ def test_standardize_positions(ps):
     assert ps.standardize_positions(positions) == ['QB', 'DST', 'K']
 
 
+def test_standardize_positions_series(ps):
+    """Tests standardize_positions with repeated positions in a Series"""
+    import pandas as pd
+    positions = pd.Series(['QB', 'Defense', 'QB', 'DEF'], index=[3, 1, 8, 5])
+    result = ps.standardize_positions(positions)
+    assert result.tolist() == ['QB', 'DST', 'QB', 'DST']
+    assert result.index.tolist() == [3, 1, 8, 5]
+    assert result.dtype == positions.dtype
+
+
 def test_standardize_teams(ps):
     """Tests standardize_teams"""
     teams = ['KCC', 'GBP', 'LAC']
     assert ps.standardize_teams(teams) == ['KC', 'GB', 'LAC']
 
+
+def test_standardize_teams_series(ps):
+    """Tests standardize_teams with repeated teams in a Series"""
+    import pandas as pd
+    teams = pd.Series(['KCC', 'GBP', 'KCC', 'LAC'], index=['a', 'b', 'c', 'd'])
+    result = ps.standardize_teams(teams)
+    assert result.tolist() == ['KC', 'GB', 'KC', 'LAC']
+    assert result.index.tolist() == ['a', 'b', 'c', 'd']
+    assert result.dtype == teams.dtype
+
+
+def test_standardize_teams_cached(ps):
+    """Tests that repeated team codes are served from the cache"""
+    from nflprojections.nflprojections import _standardize_team_code
+    _standardize_team_code.cache_clear()
+    assert ps.standardize_teams(['KCC', 'KCC', 'GBP']) == ['KC', 'KC', 'GB']
+    info = _standardize_team_code.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+@pytest.mark.parametrize('method', ['standardize_players', 'standardize_positions', 'standardize_teams'])
+def test_standardize_empty_series(ps, method):
+    """Tests that standardizing an empty Series keeps its dtype"""
+    import pandas as pd
+    s = pd.Series([], dtype=object)
+    result = getattr(ps, method)(s)
+    assert result.empty
+    assert result.dtype == object
+